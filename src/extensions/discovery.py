@@ -265,18 +265,38 @@ class OdooModelDiscovery:
 
         Args:
             model_name: Name of the model (e.g., 'purchase.order')
-            force_refresh: Force refresh of cache
+            force_refresh: Force refresh of cache. If the refetch fails, the
+                previously cached fields (possibly stale) are returned and a
+                warning is logged; {} only if nothing was cached.
 
         Returns:
             Dictionary mapping field names to FieldMetadata
         """
-        # Check TTLCache (automatically handles TTL expiration)
-        if not force_refresh:
-            cached = self._fields_cache.get(model_name)
-            if cached is not None:
-                logger.debug(f"Using cached fields for {model_name}")
-                return cached
+        if force_refresh:
+            # Replace the cached entry only once the refetch has succeeded
+            fields = self._fetch_model_fields(model_name)
+            if fields is None:
+                fields = self._fields_cache.get(model_name)
+                if fields is not None:
+                    logger.warning(f"Refreshing fields for {model_name} failed, serving cached fields")
+            else:
+                self._fields_cache.set(model_name, fields)
+            return fields if fields is not None else {}
+
+        # TTLCache handles expiration; failed lookups are not cached
+        fields = self._fields_cache.get_or_set(model_name, lambda: self._fetch_model_fields(model_name))
+        return fields if fields is not None else {}
+
+    def _fetch_model_fields(self, model_name: str) -> Optional[Dict[str, FieldMetadata]]:
+        """
+        Fetch and parse field definitions for a model from Odoo
+
+        Args:
+            model_name: Name of the model
 
+        Returns:
+            Dictionary mapping field names to FieldMetadata, or None on error
+        """
         logger.debug(f"Discovering fields for {model_name}...")
 
         try:
@@ -285,7 +305,7 @@ class OdooModelDiscovery:
 
             if "error" in fields_data:
                 logger.error(f"Error getting fields for {model_name}: {fields_data['error']}")
-                return {}
+                return None
 
             # Parse field metadata
             fields_metadata = {}
@@ -307,15 +327,12 @@ class OdooModelDiscovery:
                     logger.warning(f"Error processing field {field_name}: {e}")
                     continue
 
-            # Update TTLCache
-            self._fields_cache.set(model_name, fields_metadata)
-
             logger.debug(f"Discovered {len(fields_metadata)} fields for {model_name}")
             return fields_metadata
 
         except Exception as e:
             logger.error(f"Error in get_model_fields for {model_name}: {e}")
-            return {}
+            return None
 
     def get_safe_fields(self, model_name: str, use_smart_selector: bool = True) -> List[str]:
         """
@@ -526,12 +543,10 @@ class OdooModelDiscovery:
         Returns:
             Dictionary with model summary
         """
-        models = self.get_all_models()
-
-        if model_name not in models:
+        model_info = self.get_all_models().get(model_name)
+        if model_info is None:
             return {"error": f"Model {model_name} not found"}
 
-        model_info = models[model_name]
         fields = self.get_model_fields(model_name)
         methods = self.get_model_methods(model_name)
 
@@ -169,6 +169,30 @@ class APIKeyManager:
             )
             await db.commit()
 
+    async def log_usage_many(self, key_id: str, entries: List[Dict[str, Any]]):
+        """Log several usage records for a key in a single transaction."""
+        rows = [
+            (
+                key_id,
+                entry["endpoint"],
+                entry["method"],
+                entry.get("ip_address"),
+                entry.get("user_agent"),
+                entry.get("response_status"),
+            )
+            for entry in entries
+        ]
+        if not rows:
+            return
+
+        async with aiosqlite.connect(str(self.db_path)) as db:
+            await db.executemany(
+                """INSERT INTO api_key_usage (key_id, endpoint, method, ip_address, user_agent, response_status)
+                   VALUES (?, ?, ?, ?, ?, ?)""",
+                rows
+            )
+            await db.commit()
+
     async def get_key_usage(self, key_id: str, limit: int = 100) -> List[Dict[str, Any]]:
         async with aiosqlite.connect(str(self.db_path)) as db:
             db.row_factory = aiosqlite.Row
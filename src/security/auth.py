@@ -10,15 +10,22 @@ from fastapi import HTTPException, Request
 logger = logging.getLogger(__name__)
 
 
+def _connect(db_path):
+    """Open the app database; a "file:" path is passed on as a SQLite URI."""
+    import aiosqlite
+
+    db_path = str(db_path)
+    return aiosqlite.connect(db_path, uri=db_path.startswith("file:"))
+
+
 async def get_user_role(username: str) -> Optional[str]:
     """Get user role from database."""
-    import aiosqlite
     from src.ui.data_layer import get_database_path
 
     db_path = get_database_path()
 
     try:
-        async with aiosqlite.connect(str(db_path)) as db:
+        async with _connect(db_path) as db:
             # Check if role column exists, add if not
             cursor = await db.execute("PRAGMA table_info(app_users)")
             columns = [row[1] for row in await cursor.fetchall()]
@@ -47,7 +54,6 @@ async def get_user_role(username: str) -> Optional[str]:
 
 async def set_user_role(username: str, role: str) -> bool:
     """Set user role in database."""
-    import aiosqlite
     from src.ui.data_layer import get_database_path
 
     if role not in ("user", "admin", "readonly"):
@@ -56,7 +62,7 @@ async def set_user_role(username: str, role: str) -> bool:
     db_path = get_database_path()
 
     try:
-        async with aiosqlite.connect(str(db_path)) as db:
+        async with _connect(db_path) as db:
             await db.execute(
                 "UPDATE app_users SET role = ? WHERE username = ?",
                 (role, username)
@@ -86,7 +92,6 @@ async def get_current_user_from_session(request: Request) -> Optional[str]:
 
     Note: For production, consider implementing proper JWT validation.
     """
-    import aiosqlite
     from src.ui.data_layer import get_database_path
 
     # 1. Check X-User header (for testing/internal use)
@@ -115,7 +120,7 @@ async def get_current_user_from_session(request: Request) -> Optional[str]:
     # 3. Fallback: check if there's a single user (dev/simple setup)
     db_path = get_database_path()
     try:
-        async with aiosqlite.connect(str(db_path)) as db:
+        async with _connect(db_path) as db:
             # If only one app_user exists, use that (simple single-user setup)
             cursor = await db.execute("SELECT COUNT(*) FROM app_users")
             count = (await cursor.fetchone())[0]
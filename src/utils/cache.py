@@ -3,9 +3,17 @@ TTL-based cache with LRU eviction.
 Inspired by mcp-server-odoo caching patterns.
 """
 import threading
-import time
-from collections import OrderedDict
-from typing import Any, Dict, Optional
+from time import monotonic
+from typing import Any, Callable, Dict, NamedTuple, Optional
+
+
+class CacheStats(NamedTuple):
+    """Point-in-time cache statistics."""
+    hits: int
+    misses: int
+    hit_rate: float
+    size: int
+    max_size: Optional[int]
 
 
 class TTLCache:
@@ -13,6 +21,8 @@ class TTLCache:
     Thread-safe TTL cache with optional size-based LRU eviction.
     """
 
+    __slots__ = ("ttl_seconds", "max_size", "_cache", "_lock", "hits", "misses")
+
     def __init__(
         self,
         ttl_seconds: int = 300,
@@ -27,8 +37,9 @@ class TTLCache:
         """
         self.ttl_seconds = ttl_seconds
         self.max_size = max_size
-        self._cache: OrderedDict[str, tuple[Any, float]] = OrderedDict()
-        self._lock = threading.RLock()
+        # key -> (expiry, value); dict insertion order doubles as LRU order
+        self._cache: Dict[str, tuple[float, Any]] = {}
+        self._lock = threading.Lock()
 
         # Statistics
         self.hits = 0
@@ -39,20 +50,22 @@ class TTLCache:
         Get value from cache if exists and not expired.
         """
         with self._lock:
-            if key not in self._cache:
+            entry = self._cache.get(key)
+            if entry is None:
                 self.misses += 1
                 return None
 
-            value, timestamp = self._cache[key]
+            expiry, value = entry
 
             # Check TTL
-            if time.time() - timestamp > self.ttl_seconds:
+            if expiry < monotonic():
                 del self._cache[key]
                 self.misses += 1
                 return None
 
-            # Move to end (LRU)
-            self._cache.move_to_end(key)
+            # Re-insert to mark as most recently used
+            del self._cache[key]
+            self._cache[key] = entry
             self.hits += 1
             return value
 
@@ -61,44 +74,57 @@ class TTLCache:
         Set value in cache.
         """
         with self._lock:
-            # Evict if at max size
-            if self.max_size and len(self._cache) >= self.max_size:
-                if key not in self._cache:
-                    # Remove oldest item
-                    self._cache.popitem(last=False)
+            if key in self._cache:
+                # Re-insert so the update counts as most recently used
+                del self._cache[key]
+            elif self.max_size and len(self._cache) >= self.max_size:
+                # Evict the least recently used (first inserted) entry
+                del self._cache[next(iter(self._cache))]
+
+            self._cache[key] = (monotonic() + self.ttl_seconds, value)
+
+    def get_or_set(self, key: str, factory: Callable[[], Any]) -> Optional[Any]:
+        """
+        Get value from cache, computing and storing it on a miss.
+
+        A factory result of None is returned but not cached.
+        """
+        value = self.get(key)
+        if value is not None:
+            return value
 
-            self._cache[key] = (value, time.time())
-            self._cache.move_to_end(key)
+        value = factory()
+        if value is not None:
+            self.set(key, value)
+        return value
 
     def invalidate(self, key: str) -> None:
         """Remove a specific key from cache."""
         with self._lock:
             self._cache.pop(key, None)
 
-    def invalidate_pattern(self, pattern: str) -> int:
+    def invalidate_pattern(self, *patterns: str) -> int:
         """
-        Remove all keys matching a pattern (simple prefix match).
+        Remove all keys matching any of the patterns (simple prefix match).
         """
+        prefixes = tuple(patterns)
         with self._lock:
-            keys_to_remove = [k for k in self._cache if k.startswith(pattern)]
-            for key in keys_to_remove:
-                del self._cache[key]
-            return len(keys_to_remove)
+            before = len(self._cache)
+            self._cache = {k: v for k, v in self._cache.items() if not k.startswith(prefixes)}
+            return before - len(self._cache)
 
     def clear(self) -> None:
         """Clear all cache entries."""
         with self._lock:
             self._cache.clear()
 
-    def stats(self) -> Dict[str, Any]:
-        """Get cache statistics."""
+    def snapshot(self) -> CacheStats:
+        """Get cache statistics as a lightweight tuple."""
         with self._lock:
             total = self.hits + self.misses
             hit_rate = self.hits / total if total > 0 else 0
-            return {
-                "hits": self.hits,
-                "misses": self.misses,
-                "hit_rate": hit_rate,
-                "size": len(self._cache),
-                "max_size": self.max_size,
-            }
+            return CacheStats(self.hits, self.misses, hit_rate, len(self._cache), self.max_size)
+
+    def stats(self) -> Dict[str, Any]:
+        """Get cache statistics."""
+        return self.snapshot()._asdict()
@@ -4,6 +4,7 @@ Error sanitization for user-friendly error messages.
 Inspired by mcp-server-odoo error handling patterns.
 """
 import re
+from functools import lru_cache
 from typing import Optional
 
 
@@ -23,7 +24,9 @@ class ErrorSanitizer:
         r'/opt/[\w/.-]+',
         r'/usr/[\w/.-]+',
         # Stack traces
-        r'Traceback \(most recent call last\):.*?(?=\w+Error:|\w+Exception:|\Z)',
+        # \b keeps the lookahead from rescanning every suffix of a long word,
+        # which made this pattern quadratic on large tracebacks
+        r'Traceback \(most recent call last\):.*?(?=\b\w+Error:|\b\w+Exception:|\Z)',
         r'File ".*?", line \d+.*?\n?',
         # Python module internals
         r'xmlrpc\.client\.',
@@ -31,6 +34,25 @@ class ErrorSanitizer:
         r'psycopg2\.\w+\.',
     ]
 
+    # Compiled once at class creation instead of on every call. They run
+    # one after another: a later pattern must see the text an earlier one
+    # left, e.g. a path removed from inside a traceback span.
+    _REMOVE_SEQUENCE = tuple(re.compile(p, re.DOTALL | re.MULTILINE) for p in REMOVE_PATTERNS)
+    # Anchored at a word start for the same reason as the traceback pattern
+    _ERROR_RE = re.compile(r'\b(\w*Error|\w*Exception|\w*Warning):\s*(.+?)(?:\n|$)', re.DOTALL)
+    # Odoo model name (sale.order) or a field mention (field 'partner_id')
+    _USEFUL_RE = re.compile(r"\b[a-z]+\.[a-z_]+\b|(?i:field[s]?\s+['\"]?\w+['\"]?)")
+    _WHITESPACE_RE = re.compile(r'\s+')
+
+    # Every error-line or removal match needs one of these substrings, most
+    # common first; messages with none of them skip the regex passes entirely
+    _TRIGGERS = ('Error', '/', 'Traceback', 'File "', 'xmlrpc', 'psycopg2',
+                 'Exception', 'Warning', 'odoo.exceptions')
+
+    # Every removal match needs one of these; the extracted error detail is
+    # usually a single clean line and skips the removal pass
+    _REMOVE_TRIGGERS = ('/', 'Traceback', 'File "', 'xmlrpc', 'psycopg2', 'odoo.exceptions')
+
     # Error message mappings for common errors
     ERROR_MAPPINGS = {
         "Access Denied": "Access denied. You don't have permission for this operation.",
@@ -57,11 +79,20 @@ class ErrorSanitizer:
         if not error_message:
             return "An unknown error occurred."
 
-        result = str(error_message)
+        return cls._sanitize_text(str(error_message))
+
+    @classmethod
+    @lru_cache(maxsize=512)
+    def _sanitize_text(cls, result: str) -> str:
+        """Sanitize a non-empty message; memoized since the same errors repeat."""
+        # Fast path: nothing to extract or remove, only normalize
+        if not any(trigger in result for trigger in cls._TRIGGERS):
+            result = cls._normalize(result)
+            return result if result else "An error occurred during the operation."
 
         # Extract the main error type and message
         # Pattern: "SomeError: actual message" or "SomeException: message" or "SomeWarning: message"
-        error_match = re.search(r'(\w*Error|\w*Exception|\w*Warning):\s*(.+?)(?:\n|$)', result, re.DOTALL)
+        error_match = cls._ERROR_RE.search(result)
         if error_match:
             error_type = error_match.group(1)
             error_detail = error_match.group(2).strip()
@@ -82,16 +113,15 @@ class ErrorSanitizer:
 
         return result if result else "An error occurred during the operation."
 
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Drop memoized results, e.g. after changing ERROR_MAPPINGS."""
+        cls._sanitize_text.cache_clear()
+
     @classmethod
     def _contains_useful_info(cls, message: str) -> bool:
         """Check if text contains useful info like model/field names."""
-        # Check for Odoo model names
-        if re.search(r'\b[a-z]+\.[a-z_]+\b', message):
-            return True
-        # Check for field names
-        if re.search(r"field[s]?\s+['\"]?\w+['\"]?", message, re.IGNORECASE):
-            return True
-        return False
+        return cls._USEFUL_RE.search(message) is not None
 
     @classmethod
     def _clean_detail(cls, detail: str) -> str:
@@ -99,13 +129,17 @@ class ErrorSanitizer:
         result = detail
 
         # Remove patterns
-        for pattern in cls.REMOVE_PATTERNS:
-            result = re.sub(pattern, '', result, flags=re.DOTALL | re.MULTILINE)
+        if any(trigger in result for trigger in cls._REMOVE_TRIGGERS):
+            for pattern in cls._REMOVE_SEQUENCE:
+                result = pattern.sub('', result)
+
+        return cls._normalize(result)
 
+    @classmethod
+    def _normalize(cls, text: str) -> str:
+        """Collapse whitespace and strip surrounding quotes."""
         # Clean up multiple whitespace/newlines
-        result = re.sub(r'\s+', ' ', result).strip()
+        result = cls._WHITESPACE_RE.sub(' ', text).strip()
 
         # Remove leading/trailing quotes
-        result = result.strip('"\'')
-
-        return result
+        return result.strip('"\'')
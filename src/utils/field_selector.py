@@ -2,7 +2,51 @@
 Smart field selection for Odoo queries.
 Inspired by mcp-server-odoo field importance scoring.
 """
-from typing import Dict, List, Optional, Set
+import heapq
+import re
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Dict, Final, FrozenSet, List, Optional, Set, Tuple
+
+
+# Essential fields (always included)
+ESSENTIAL_FIELDS: Final[FrozenSet[str]] = frozenset({"id", "name", "display_name", "active"})
+
+# Field types to exclude (too large for responses)
+EXCLUDED_TYPES: Final[FrozenSet[str]] = frozenset({"binary", "html"})
+
+# Recent select() results, least recently used first
+_SELECT_CACHE_SIZE = 64
+_SELECT_CACHE: "OrderedDict[tuple, Tuple[str, ...]]" = OrderedDict()
+_SELECT_LOCK = threading.Lock()
+
+# Per-field flag bits, packed once so scoring is plain arithmetic
+_REQUIRED = 1
+_STORED = 2
+_SEARCHABLE = 4
+
+
+def _field_flags(field_meta: Dict) -> int:
+    """Pack the required/stored/searchable flags of a field into a bitmask."""
+    return (
+        bool(field_meta.get("required"))
+        | bool(field_meta.get("store", True)) << 1
+        | bool(field_meta.get("searchable", False)) << 2
+    )
+
+
+def _first_pattern_score(field_lower: str, patterns: Dict[str, int]) -> int:
+    """Score of the first pattern (in dict order) contained in the name."""
+    for pattern, pattern_score in patterns.items():
+        if pattern in field_lower:
+            return pattern_score
+    return 0
+
+
+def _exact_pattern_scores(patterns: Dict[str, int]) -> Dict[str, int]:
+    """Precompute the score of each pattern used as a whole field name."""
+    return {pattern: _first_pattern_score(pattern, patterns) for pattern in patterns}
 
 
 class SmartFieldSelector:
@@ -11,11 +55,9 @@ class SmartFieldSelector:
     based on importance scoring algorithm.
     """
 
-    # Essential fields (always included)
-    ESSENTIAL_FIELDS = {"id", "name", "display_name", "active"}
-
-    # Field types to exclude (too large for responses)
-    EXCLUDED_TYPES = {"binary", "html"}
+    # Module constants, also exposed on the class for existing callers
+    ESSENTIAL_FIELDS = ESSENTIAL_FIELDS
+    EXCLUDED_TYPES = EXCLUDED_TYPES
 
     # Business-important field patterns
     BUSINESS_PATTERNS = {
@@ -37,6 +79,12 @@ class SmartFieldSelector:
         "write_date": 110,
     }
 
+    # Names that are themselves a pattern resolve with one dict lookup; any
+    # other name is only walked through the patterns if the union matches.
+    # Both keep the first-in-order rule, e.g. "create_date" scores as "date".
+    _PATTERN_EXACT = _exact_pattern_scores(BUSINESS_PATTERNS)
+    _PATTERN_RE = re.compile("|".join(map(re.escape, BUSINESS_PATTERNS)))
+
     # Field type scores
     TYPE_SCORES = {
         "char": 100,
@@ -64,28 +112,66 @@ class SmartFieldSelector:
         Select the most important fields based on scoring.
         """
         exclude_fields = exclude_fields or set()
-        scored_fields = []
-
-        for field_name, field_meta in fields_info.items():
-            # Skip excluded fields
-            if field_name in exclude_fields:
-                continue
-
-            # Skip excluded types
-            field_type = field_meta.get("type", "")
-            if field_type in cls.EXCLUDED_TYPES:
-                continue
+        # Everything the selection depends on, per field and in dict order
+        # (order breaks score ties), so it doubles as the cache key
+        entries = tuple(
+            (
+                field_name,
+                field_meta.get("type", ""),
+                _field_flags(field_meta),
+                field_meta.get("store") is not False,
+            )
+            for field_name, field_meta in fields_info.items()
+        )
+        key = (cls, entries, limit, frozenset(exclude_fields))
+
+        with _SELECT_LOCK:
+            cached = _SELECT_CACHE.get(key)
+            if cached is not None:
+                _SELECT_CACHE.move_to_end(key)
+                return list(cached)
+
+        result = cls._select(fields_info, entries, limit, exclude_fields)
+
+        with _SELECT_LOCK:
+            _SELECT_CACHE[key] = tuple(result)
+            if len(_SELECT_CACHE) > _SELECT_CACHE_SIZE:
+                _SELECT_CACHE.popitem(last=False)
 
-            # Skip computed fields without store
-            if field_meta.get("store") is False:
-                continue
+        return result
 
-            # Calculate score
-            score = cls._calculate_score(field_name, field_meta)
-            scored_fields.append((field_name, score))
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Drop memoized selections, e.g. after changing the scoring tables."""
+        with _SELECT_LOCK:
+            _SELECT_CACHE.clear()
+        cls._pattern_score.cache_clear()
 
-        # Sort by score descending
-        scored_fields.sort(key=lambda x: x[1], reverse=True)
+    @classmethod
+    def _select(
+        cls,
+        fields_info: Dict[str, Dict],
+        entries: Tuple[Tuple[str, str, int, bool], ...],
+        limit: int,
+        exclude_fields: Set[str],
+    ) -> List[str]:
+        """Score and rank the fields described by entries."""
+        # Drop excluded names, excluded types and non-stored computed fields
+        # in one cheap pass, so only the survivors are scored
+        candidates = [
+            (field_name, field_type, flags)
+            for field_name, field_type, flags, stored in entries
+            if field_name not in exclude_fields
+            and field_type not in cls.EXCLUDED_TYPES
+            and stored
+        ]
+
+        # Candidate names and their scores as parallel lists
+        names = [field_name for field_name, _, _ in candidates]
+        scores = [
+            cls._score_field(field_name, field_type, flags)
+            for field_name, field_type, flags in candidates
+        ]
 
         # Always include essential fields first
         result = []
@@ -93,45 +179,50 @@ class SmartFieldSelector:
             if f in fields_info and f not in exclude_fields:
                 result.append(f)
 
-        # Add top scored fields up to limit
-        for field_name, score in scored_fields:
-            if field_name not in result:
-                result.append(field_name)
-                if len(result) >= limit:
-                    break
+        # Add top scored fields up to limit (at least one, as before); only
+        # the k best are needed, so a bounded heap replaces a full sort.
+        # nlargest is stable on ties, matching the previous sort order.
+        remaining = [i for i, field_name in enumerate(names) if field_name not in result]
+        top = heapq.nlargest(max(limit - len(result), 1), remaining, key=scores.__getitem__)
+        result.extend(names[i] for i in top)
 
         return result
 
     @classmethod
     def _calculate_score(cls, field_name: str, field_meta: Dict) -> int:
         """Calculate importance score for a field."""
-        score = 0
+        return cls._score_field(field_name, field_meta.get("type", ""), _field_flags(field_meta))
+
+    @classmethod
+    def _score_field(cls, field_name: str, field_type: str, flags: int) -> int:
+        """Score a field from its type and packed flag bits."""
+        # Type score, one table lookup with 50 for unknown types
+        score = cls.TYPE_SCORES.get(field_type, 50)
 
         # Essential field bonus
         if field_name in cls.ESSENTIAL_FIELDS:
             score += 1000
 
-        # Required field bonus
-        if field_meta.get("required"):
-            score += 500
-
-        # Type score
-        field_type = field_meta.get("type", "")
-        score += cls.TYPE_SCORES.get(field_type, 50)
-
         # Business pattern bonus
-        field_lower = field_name.lower()
-        for pattern, pattern_score in cls.BUSINESS_PATTERNS.items():
-            if pattern in field_lower:
-                score += pattern_score
-                break
-
-        # Stored field bonus
-        if field_meta.get("store", True):
-            score += 50
+        score += cls._pattern_score(field_name)
 
-        # Searchable bonus
-        if field_meta.get("searchable", False):
-            score += 30
+        # Required (500), stored (50) and searchable (30) bonuses
+        score += (
+            (flags & _REQUIRED) * 500
+            + (flags & _STORED) // _STORED * 50
+            + (flags & _SEARCHABLE) // _SEARCHABLE * 30
+        )
 
         return score
+
+    @classmethod
+    @lru_cache(maxsize=4096)
+    def _pattern_score(cls, field_name: str) -> int:
+        """Business pattern bonus for a name; memoized since models share names."""
+        field_lower = field_name.lower()
+        pattern_score = cls._PATTERN_EXACT.get(field_lower)
+        if pattern_score is None:
+            pattern_score = 0
+            if cls._PATTERN_RE.search(field_lower):
+                pattern_score = _first_pattern_score(field_lower, cls.BUSINESS_PATTERNS)
+        return pattern_score
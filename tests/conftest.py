@@ -1,9 +1,12 @@
 """
 Pytest configuration and fixtures for Odoo AI Agent tests.
 """
+import asyncio
 import os
 import sys
 import pytest
+from copy import deepcopy
+from types import SimpleNamespace
 from typing import Optional
 from unittest.mock import MagicMock, AsyncMock
 
@@ -14,6 +17,8 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 from dotenv import load_dotenv
 load_dotenv()
 
+from src.config import Settings
+
 
 # ============================================
 # Environment Fixtures
@@ -55,6 +60,68 @@ def get_llm_api_key():
     )
 
 
+# ============================================
+# Async Fixtures
+# ============================================
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_asyncio_loop_factories(config, item):
+    """Run async tests on uvloop where it is supported.
+
+    Optional so that pytest-asyncio releases without this hook still load
+    the conftest; those run on the default asyncio loop instead.
+    """
+    if sys.platform.startswith("win"):
+        return {"asyncio": asyncio.new_event_loop}
+
+    import uvloop
+    return {"uvloop": uvloop.new_event_loop}
+
+
+# ============================================
+# Mock Odoo Payloads
+# ============================================
+
+# Built once at import as templates; every mock client gets its own deep
+# copy, so a test cannot leak mutations into the next one.
+_MODELS_PAYLOAD = {
+    "model_names": [
+        "res.partner", "res.users", "sale.order", "purchase.order",
+        "product.product", "product.template", "account.move",
+        "stock.picking", "hr.employee", "crm.lead",
+    ],
+    "models_details": {
+        "res.partner": {"name": "Contact"},
+        "res.users": {"name": "Users"},
+        "sale.order": {"name": "Sales Order"},
+        "purchase.order": {"name": "Purchase Order"},
+        "product.product": {"name": "Product"},
+        "product.template": {"name": "Product Template"},
+        "account.move": {"name": "Journal Entry"},
+        "stock.picking": {"name": "Transfer"},
+        "hr.employee": {"name": "Employee"},
+        "crm.lead": {"name": "Lead/Opportunity"},
+    },
+}
+
+_SEARCH_READ_PAYLOAD = [
+    {"id": 1, "name": "Test Record 1", "display_name": "Test Record 1"},
+    {"id": 2, "name": "Test Record 2", "display_name": "Test Record 2"},
+]
+
+_MODEL_INFO = {
+    "name": "Contact",
+    "model": "res.partner",
+}
+
+_MODEL_FIELDS = {
+    "id": {"type": "integer", "string": "ID"},
+    "name": {"type": "char", "string": "Name", "required": True},
+    "email": {"type": "char", "string": "Email"},
+    "phone": {"type": "char", "string": "Phone"},
+}
+
+
 # ============================================
 # Odoo Client Fixtures
 # ============================================
@@ -71,59 +138,35 @@ def odoo_client(check_env_vars):
         pytest.skip(f"Could not connect to Odoo: {e}")
 
 
+def create_mock_odoo_client():
+    """Build a mock Odoo client preloaded with copies of the shared payloads.
+
+    Only the client methods the app calls are provided, each as an explicit
+    MagicMock so call assertions still work on them.
+    """
+    return SimpleNamespace(
+        uid=1,
+        url="http://test-odoo.com",
+        db="test_db",
+        get_models=MagicMock(name="get_models", return_value=deepcopy(_MODELS_PAYLOAD)),
+        get_model_info=MagicMock(name="get_model_info", return_value=deepcopy(_MODEL_INFO)),
+        get_model_fields=MagicMock(name="get_model_fields", return_value=deepcopy(_MODEL_FIELDS)),
+        search_read=MagicMock(name="search_read", return_value=deepcopy(_SEARCH_READ_PAYLOAD)),
+        execute_method=MagicMock(name="execute_method", return_value=True),
+    )
+
+
+def reset_mock_odoo_client(client):
+    """Clear the recorded calls on every mocked client method."""
+    for attr in vars(client).values():
+        if isinstance(attr, MagicMock):
+            attr.reset_mock()
+
+
 @pytest.fixture
 def mock_odoo_client():
     """Create a mock Odoo client for unit tests."""
-    mock = MagicMock()
-    mock.uid = 1
-    mock.url = "http://test-odoo.com"
-    mock.db = "test_db"
-
-    # Mock get_models response
-    mock.get_models.return_value = {
-        "model_names": [
-            "res.partner", "res.users", "sale.order", "purchase.order",
-            "product.product", "product.template", "account.move",
-            "stock.picking", "hr.employee", "crm.lead"
-        ],
-        "models_details": {
-            "res.partner": {"name": "Contact"},
-            "res.users": {"name": "Users"},
-            "sale.order": {"name": "Sales Order"},
-            "purchase.order": {"name": "Purchase Order"},
-            "product.product": {"name": "Product"},
-            "product.template": {"name": "Product Template"},
-            "account.move": {"name": "Journal Entry"},
-            "stock.picking": {"name": "Transfer"},
-            "hr.employee": {"name": "Employee"},
-            "crm.lead": {"name": "Lead/Opportunity"},
-        }
-    }
-
-    # Mock search_read response
-    mock.search_read.return_value = [
-        {"id": 1, "name": "Test Record 1", "display_name": "Test Record 1"},
-        {"id": 2, "name": "Test Record 2", "display_name": "Test Record 2"},
-    ]
-
-    # Mock get_model_info response
-    mock.get_model_info.return_value = {
-        "name": "Contact",
-        "model": "res.partner",
-    }
-
-    # Mock get_model_fields response
-    mock.get_model_fields.return_value = {
-        "id": {"type": "integer", "string": "ID"},
-        "name": {"type": "char", "string": "Name", "required": True},
-        "email": {"type": "char", "string": "Email"},
-        "phone": {"type": "char", "string": "Phone"},
-    }
-
-    # Mock execute_method
-    mock.execute_method.return_value = True
-
-    return mock
+    return create_mock_odoo_client()
 
 
 # ============================================
@@ -144,6 +187,26 @@ def real_discovery_service(odoo_client):
     return OdooModelDiscovery(odoo_client, cache_ttl=300)
 
 
+# Models the integration tests read fields for
+_WARM_MODELS = ("res.partner", "res.users", "res.company", "sale.order")
+
+
+@pytest.fixture(scope="session")
+def shared_discovery(odoo_client):
+    """Discovery service over the real Odoo client, pre-warmed once per session.
+
+    Warming happens here rather than in an autouse fixture, so runs without
+    Odoo credentials only skip the tests that actually need Odoo.
+    """
+    from src.extensions.discovery import OdooModelDiscovery
+
+    discovery = OdooModelDiscovery(odoo_client, cache_ttl=3600)
+    discovery.get_all_models()
+    for model_name in _WARM_MODELS:
+        discovery.get_model_fields(model_name)
+    return discovery
+
+
 # ============================================
 # Agent Fixtures
 # ============================================
@@ -194,14 +257,19 @@ def settings():
     return get_settings()
 
 
+# Canonical test profile, validated once and copied per test
+_FROZEN_TEST_SETTINGS = Settings(
+    _env_file=None,
+    odoo_url="http://test-odoo.com",
+    odoo_db="test_db",
+    odoo_username="admin",
+    odoo_password="admin",
+    read_only_mode=True,
+)
+
+
 @pytest.fixture
-def test_settings(monkeypatch):
+def test_settings():
     """Create test settings with controlled values."""
-    monkeypatch.setenv("ODOO_URL", "http://test-odoo.com")
-    monkeypatch.setenv("ODOO_DB", "test_db")
-    monkeypatch.setenv("ODOO_USERNAME", "admin")
-    monkeypatch.setenv("ODOO_PASSWORD", "admin")
-    monkeypatch.setenv("READ_ONLY_MODE", "true")
-
-    from src.config import reload_settings
-    return reload_settings()
+    return _FROZEN_TEST_SETTINGS.model_copy(deep=True)
+
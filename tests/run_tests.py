@@ -15,6 +15,7 @@ import os
 import sys
 import argparse
 import subprocess
+from importlib.util import find_spec
 
 # Add project root to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
@@ -22,17 +23,13 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
 def check_dependencies():
     """Check if required test dependencies are installed."""
-    missing = []
-
-    try:
-        import pytest
-    except ImportError:
-        missing.append("pytest")
-
-    try:
-        import pytest_asyncio
-    except ImportError:
-        missing.append("pytest-asyncio")
+    # find_spec only consults the import finders, so availability can be
+    # checked without executing pytest's plugin discovery.
+    missing = [
+        name.replace("_", "-")
+        for name in ("pytest", "pytest_asyncio")
+        if find_spec(name) is None
+    ]
 
     if missing:
         print(f"Missing dependencies: {', '.join(missing)}")
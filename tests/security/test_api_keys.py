@@ -1,4 +1,5 @@
 """Tests for API Key Manager."""
+import asyncio
 import pytest
 from datetime import datetime, timedelta
 from pathlib import Path
@@ -102,8 +103,10 @@ class TestAPIKeyManager:
     @pytest.mark.asyncio
     async def test_list_keys_hides_hash(self, manager):
         """list_keys returns keys without the full hash."""
-        await manager.create_key(name="Key 1", created_by="admin")
-        await manager.create_key(name="Key 2", created_by="admin")
+        await asyncio.gather(
+            manager.create_key(name="Key 1", created_by="admin"),
+            manager.create_key(name="Key 2", created_by="admin"),
+        )
 
         keys = await manager.list_keys()
 
@@ -143,21 +146,23 @@ class TestAPIKeyManager:
         created = await manager.create_key(name="Usage Key", created_by="admin")
 
         # Log some usage
-        await manager.log_usage(
-            key_id=created["id"],
-            endpoint="/api/v1/test",
-            method="GET",
-            ip_address="192.168.1.1",
-            user_agent="TestAgent/1.0",
-            response_status=200,
-        )
-        await manager.log_usage(
-            key_id=created["id"],
-            endpoint="/api/v1/other",
-            method="POST",
-            ip_address="192.168.1.2",
-            user_agent="TestAgent/1.0",
-            response_status=201,
+        await asyncio.gather(
+            manager.log_usage(
+                key_id=created["id"],
+                endpoint="/api/v1/test",
+                method="GET",
+                ip_address="192.168.1.1",
+                user_agent="TestAgent/1.0",
+                response_status=200,
+            ),
+            manager.log_usage(
+                key_id=created["id"],
+                endpoint="/api/v1/other",
+                method="POST",
+                ip_address="192.168.1.2",
+                user_agent="TestAgent/1.0",
+                response_status=201,
+            ),
         )
 
         # Get usage
@@ -190,13 +195,13 @@ class TestAPIKeyManager:
         created = await manager.create_key(name="Limited Key", created_by="admin")
 
         # Log many usages
-        for i in range(10):
-            await manager.log_usage(
-                key_id=created["id"],
-                endpoint=f"/api/v1/endpoint{i}",
-                method="GET",
-                response_status=200,
-            )
+        await manager.log_usage_many(
+            created["id"],
+            [
+                {"endpoint": f"/api/v1/endpoint{i}", "method": "GET", "response_status": 200}
+                for i in range(10)
+            ],
+        )
 
         # Get with limit
         usage = await manager.get_key_usage(created["id"], limit=5)
@@ -1,27 +1,88 @@
 """Tests for admin authentication."""
+import sqlite3
+from types import SimpleNamespace
+
 import pytest
 import aiosqlite
-from unittest.mock import MagicMock
+
+
+AUTH_DB_URI = "file:authtest?mode=memory&cache=shared"
+
+INSERT_USER_SQL = "INSERT INTO app_users (username, password_hash, role) VALUES (?, ?, ?)"
+
+# Users every test starts with; tests that need another state change it
+# themselves and test_db restores this set afterwards.
+SEED_USERS = [
+    ("admin", "h", "admin"),
+    ("user1", "h", "user"),
+    ("u1", "h", None),
+    ("u2", "h", None),
+]
+
+
+@pytest.fixture(scope="module")
+def auth_db_uri():
+    """Create and seed app_users once per module in a shared in-memory database.
+
+    The connection opened here stays open until the module finishes, which
+    keeps the shared-cache database alive for every other connection to the
+    URI; the data layer is only pointed at it for this module's tests.
+    """
+    conn = sqlite3.connect(AUTH_DB_URI, uri=True)
+    conn.execute("""
+        CREATE TABLE app_users (
+            id INTEGER PRIMARY KEY,
+            username TEXT UNIQUE,
+            password_hash TEXT,
+            role TEXT DEFAULT 'user'
+        )
+    """)
+    conn.executemany(INSERT_USER_SQL, SEED_USERS)
+    conn.commit()
+
+    try:
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setattr("src.ui.data_layer.get_database_path", lambda: AUTH_DB_URI)
+            yield AUTH_DB_URI
+    finally:
+        conn.close()
 
 
 @pytest.fixture
-async def test_db(tmp_path, monkeypatch):
-    """Create a test database with app_users table."""
-    db_path = tmp_path / "test.db"
-    monkeypatch.setattr("src.ui.data_layer.get_database_path", lambda: db_path)
+async def test_db(auth_db_uri):
+    """Open one connection to the shared test database for the test.
+
+    The code under test opens its own connections, so changes cannot be
+    rolled back; the seeded users are restored on teardown if a test
+    modified them.
+    """
+    async with aiosqlite.connect(auth_db_uri, uri=True) as db:
+        yield db
+        cursor = await db.execute(
+            "SELECT username, password_hash, role FROM app_users ORDER BY id"
+        )
+        if await cursor.fetchall() != SEED_USERS:
+            await db.execute("DELETE FROM app_users")
+            await db.executemany(INSERT_USER_SQL, SEED_USERS)
+            await db.commit()
+
+
+def make_request(header=None, cookie=None):
+    """Build a minimal request whose X-User header and cookie lookups return fixed values."""
+    return SimpleNamespace(
+        headers=SimpleNamespace(get=lambda key, default=None: header),
+        cookies=SimpleNamespace(get=lambda key, default=None: cookie),
+    )
+
 
-    async with aiosqlite.connect(str(db_path)) as db:
-        await db.execute("""
-            CREATE TABLE app_users (
-                id INTEGER PRIMARY KEY,
-                username TEXT UNIQUE,
-                password_hash TEXT,
-                role TEXT DEFAULT 'user'
-            )
-        """)
-        await db.commit()
+@pytest.fixture
+def seed_users(test_db):
+    """Return a helper that inserts (username, password_hash, role) rows in one batch."""
+    async def _seed(rows):
+        await test_db.executemany(INSERT_USER_SQL, rows)
+        await test_db.commit()
 
-    return db_path
+    return _seed
 
 
 class TestGetUserRole:
@@ -30,12 +91,6 @@ class TestGetUserRole:
     @pytest.mark.asyncio
     async def test_returns_admin_role(self, test_db):
         """Returns admin role for admin user."""
-        async with aiosqlite.connect(str(test_db)) as db:
-            await db.execute(
-                "INSERT INTO app_users (username, password_hash, role) VALUES ('admin', 'hash', 'admin')"
-            )
-            await db.commit()
-
         from src.security.auth import get_user_role
         role = await get_user_role("admin")
         assert role == "admin"
@@ -43,14 +98,8 @@ class TestGetUserRole:
     @pytest.mark.asyncio
     async def test_returns_user_role_default(self, test_db):
         """Returns user role when role is null."""
-        async with aiosqlite.connect(str(test_db)) as db:
-            await db.execute(
-                "INSERT INTO app_users (username, password_hash, role) VALUES ('user1', 'hash', NULL)"
-            )
-            await db.commit()
-
         from src.security.auth import get_user_role
-        role = await get_user_role("user1")
+        role = await get_user_role("u1")
         assert role == "user"
 
     @pytest.mark.asyncio
@@ -67,12 +116,6 @@ class TestSetUserRole:
     @pytest.mark.asyncio
     async def test_sets_role_successfully(self, test_db):
         """Successfully sets user role."""
-        async with aiosqlite.connect(str(test_db)) as db:
-            await db.execute(
-                "INSERT INTO app_users (username, password_hash, role) VALUES ('user1', 'hash', 'user')"
-            )
-            await db.commit()
-
         from src.security.auth import set_user_role, get_user_role
         result = await set_user_role("user1", "admin")
         assert result is True
@@ -95,24 +138,12 @@ class TestIsAdmin:
     @pytest.mark.asyncio
     async def test_returns_true_for_admin(self, test_db):
         """Returns True for admin user."""
-        async with aiosqlite.connect(str(test_db)) as db:
-            await db.execute(
-                "INSERT INTO app_users (username, password_hash, role) VALUES ('admin', 'hash', 'admin')"
-            )
-            await db.commit()
-
         from src.security.auth import is_admin
         assert await is_admin("admin") is True
 
     @pytest.mark.asyncio
     async def test_returns_false_for_user(self, test_db):
         """Returns False for regular user."""
-        async with aiosqlite.connect(str(test_db)) as db:
-            await db.execute(
-                "INSERT INTO app_users (username, password_hash, role) VALUES ('user1', 'hash', 'user')"
-            )
-            await db.commit()
-
         from src.security.auth import is_admin
         assert await is_admin("user1") is False
 
@@ -131,27 +162,20 @@ class TestGetCurrentUserFromSession:
         """Returns user from X-User header."""
         from src.security.auth import get_current_user_from_session
 
-        request = MagicMock()
-        request.headers.get.return_value = "testuser"
-        request.cookies.get.return_value = None
+        request = make_request(header="testuser")
 
         user = await get_current_user_from_session(request)
         assert user == "testuser"
 
     @pytest.mark.asyncio
-    async def test_returns_single_user_fallback(self, test_db):
+    async def test_returns_single_user_fallback(self, test_db, seed_users):
         """Returns single user when only one exists."""
-        async with aiosqlite.connect(str(test_db)) as db:
-            await db.execute(
-                "INSERT INTO app_users (username, password_hash, role) VALUES ('onlyuser', 'hash', 'admin')"
-            )
-            await db.commit()
+        await test_db.execute("DELETE FROM app_users")
+        await seed_users([("onlyuser", "hash", "admin")])
 
         from src.security.auth import get_current_user_from_session
 
-        request = MagicMock()
-        request.headers.get.return_value = None
-        request.cookies.get.return_value = None
+        request = make_request()
 
         user = await get_current_user_from_session(request)
         assert user == "onlyuser"
@@ -159,20 +183,9 @@ class TestGetCurrentUserFromSession:
     @pytest.mark.asyncio
     async def test_returns_none_no_auth(self, test_db):
         """Returns None when no auth info available and multiple users."""
-        async with aiosqlite.connect(str(test_db)) as db:
-            await db.execute(
-                "INSERT INTO app_users (username, password_hash) VALUES ('user1', 'hash')"
-            )
-            await db.execute(
-                "INSERT INTO app_users (username, password_hash) VALUES ('user2', 'hash')"
-            )
-            await db.commit()
-
         from src.security.auth import get_current_user_from_session
 
-        request = MagicMock()
-        request.headers.get.return_value = None
-        request.cookies.get.return_value = None
+        request = make_request()
 
         user = await get_current_user_from_session(request)
         assert user is None
@@ -192,19 +205,8 @@ class TestRequireAdmin:
         from fastapi import HTTPException
         from src.security.auth import require_admin
 
-        request = MagicMock()
-        request.headers.get.return_value = None
-        request.cookies.get.return_value = None
-
-        # Multiple users so fallback doesn't work
-        async with aiosqlite.connect(str(test_db)) as db:
-            await db.execute(
-                "INSERT INTO app_users (username, password_hash) VALUES ('u1', 'h')"
-            )
-            await db.execute(
-                "INSERT INTO app_users (username, password_hash) VALUES ('u2', 'h')"
-            )
-            await db.commit()
+        # Multiple seeded users so the single-user fallback doesn't apply
+        request = make_request()
 
         with pytest.raises(HTTPException) as exc:
             await require_admin(request)
@@ -216,15 +218,7 @@ class TestRequireAdmin:
         from fastapi import HTTPException
         from src.security.auth import require_admin
 
-        async with aiosqlite.connect(str(test_db)) as db:
-            await db.execute(
-                "INSERT INTO app_users (username, password_hash, role) VALUES ('user1', 'h', 'user')"
-            )
-            await db.commit()
-
-        request = MagicMock()
-        request.headers.get.return_value = "user1"
-        request.cookies.get.return_value = None
+        request = make_request(header="user1")
 
         with pytest.raises(HTTPException) as exc:
             await require_admin(request)
@@ -235,15 +229,7 @@ class TestRequireAdmin:
         """Returns username when user is admin."""
         from src.security.auth import require_admin
 
-        async with aiosqlite.connect(str(test_db)) as db:
-            await db.execute(
-                "INSERT INTO app_users (username, password_hash, role) VALUES ('admin', 'h', 'admin')"
-            )
-            await db.commit()
-
-        request = MagicMock()
-        request.headers.get.return_value = "admin"
-        request.cookies.get.return_value = None
+        request = make_request(header="admin")
 
         result = await require_admin(request)
         assert result == "admin"
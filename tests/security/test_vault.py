@@ -3,35 +3,37 @@ import pytest
 from pathlib import Path
 
 
+# Any valid Fernet key (32 bytes, urlsafe base64); fixed so the test needs no key generation
+PRECOMPUTED_FERNET_KEY = "AAECAwQFBgcICQoLDA0ODxAREhMUFRYXGBkaGxwdHh8="
+
+
+@pytest.fixture(scope="session")
+def session_vault(tmp_path_factory):
+    """One vault shared by tests that only exercise encryption."""
+    from src.security.vault import SecretVault, get_or_create_master_key
+
+    key_file = tmp_path_factory.mktemp("vault") / "test.key"
+    key = get_or_create_master_key(key_file=key_file)
+    return SecretVault(key)
+
+
 class TestSecretVault:
     """Test SecretVault encryption/decryption."""
 
-    def test_encrypt_decrypt_roundtrip(self, tmp_path):
+    def test_encrypt_decrypt_roundtrip(self, session_vault):
         """Encrypted value can be decrypted back."""
-        from src.security.vault import SecretVault, get_or_create_master_key
-
-        key_file = tmp_path / "test.key"
-        key = get_or_create_master_key(key_file=key_file)
-        vault = SecretVault(key)
-
         original = "my-secret-password-123"
-        encrypted = vault.encrypt(original)
-        decrypted = vault.decrypt(encrypted)
+        encrypted = session_vault.encrypt(original)
+        decrypted = session_vault.decrypt(encrypted)
 
         assert decrypted == original
         assert encrypted != original
 
-    def test_encrypted_value_is_different_each_time(self, tmp_path):
+    def test_encrypted_value_is_different_each_time(self, session_vault):
         """Same value produces different ciphertext (IV)."""
-        from src.security.vault import SecretVault, get_or_create_master_key
-
-        key_file = tmp_path / "test.key"
-        key = get_or_create_master_key(key_file=key_file)
-        vault = SecretVault(key)
-
         value = "same-secret"
-        encrypted1 = vault.encrypt(value)
-        encrypted2 = vault.encrypt(value)
+        encrypted1 = session_vault.encrypt(value)
+        encrypted2 = session_vault.encrypt(value)
 
         assert encrypted1 != encrypted2
 
@@ -63,10 +65,9 @@ class TestSecretVault:
 
     def test_get_or_create_master_key_from_env(self, tmp_path, monkeypatch):
         """Key from environment variable takes priority."""
-        from cryptography.fernet import Fernet
         from src.security.vault import get_or_create_master_key
 
-        env_key = Fernet.generate_key().decode()
+        env_key = PRECOMPUTED_FERNET_KEY
         monkeypatch.setenv("ENCRYPTION_KEY", env_key)
 
         key_file = tmp_path / "ignored.key"
@@ -6,14 +6,37 @@ Tests the agent's ability to understand user intent and route to appropriate ope
 import pytest
 from unittest.mock import MagicMock, AsyncMock, patch
 
+from src.agent.langchain_agent import OdooAgent, IntentRouter
+from src.config import Settings
+from src.extensions.discovery import OdooModelDiscovery
+from tests.conftest import create_mock_odoo_client, get_llm_api_key, reset_mock_odoo_client
+
+requires_llm = pytest.mark.skipif(not get_llm_api_key(), reason="No LLM API key configured")
+
+
+@pytest.fixture(scope="module")
+def module_agent():
+    """One agent for the handler tests, backed by its own mock Odoo client.
+
+    Every test using it is marked requires_llm, so it is never built without a key.
+    """
+    odoo = create_mock_odoo_client()
+    return OdooAgent(odoo, OdooModelDiscovery(odoo, cache_ttl=60))
+
+
+@pytest.fixture
+def agent(module_agent):
+    """Shared agent with its mock call history and conversation reset after each test."""
+    yield module_agent
+    reset_mock_odoo_client(module_agent.odoo)
+    module_agent.clear_history()
+
 
 class TestIntentRouter:
     """Test intent routing functionality."""
 
     def test_router_initialization(self, mock_odoo_client):
         """Test that IntentRouter initializes correctly."""
-        from src.agent.langchain_agent import IntentRouter
-
         mock_llm = MagicMock()
         router = IntentRouter(mock_llm, mock_odoo_client)
 
@@ -23,8 +46,6 @@ class TestIntentRouter:
 
     def test_get_available_models_info(self, mock_odoo_client):
         """Test dynamic model info generation."""
-        from src.agent.langchain_agent import IntentRouter
-
         mock_llm = MagicMock()
         router = IntentRouter(mock_llm, mock_odoo_client)
 
@@ -37,8 +58,6 @@ class TestIntentRouter:
 
     def test_models_info_caching(self, mock_odoo_client):
         """Test that models info is cached."""
-        from src.agent.langchain_agent import IntentRouter
-
         mock_llm = MagicMock()
         router = IntentRouter(mock_llm, mock_odoo_client)
 
@@ -57,9 +76,6 @@ class TestOdooAgent:
 
     def test_agent_initialization_requires_llm_key(self, mock_odoo_client, discovery_service, monkeypatch):
         """Test that agent requires LLM API key."""
-        from src.agent.langchain_agent import OdooAgent
-        from src.config import Settings
-
         mock_settings = MagicMock(spec=Settings)
         mock_settings.llm_provider = "anthropic"
         mock_settings.anthropic_api_key = None  # No key
@@ -71,51 +87,31 @@ class TestOdooAgent:
         with pytest.raises(ValueError, match="API_KEY is required"):
             OdooAgent(mock_odoo_client, discovery_service)
 
-    def test_agent_clear_history(self, mock_odoo_client, discovery_service, monkeypatch):
+    @requires_llm
+    def test_agent_clear_history(self, agent):
         """Test clearing conversation history."""
-        import os
-        from tests.conftest import get_llm_api_key
-        if not get_llm_api_key():
-            pytest.skip("No LLM API key configured")
-
-        from src.agent.langchain_agent import OdooAgent
-
-        agent = OdooAgent(mock_odoo_client, discovery_service)
         agent.history = [{"role": "user", "content": "test"}]
 
         agent.clear_history()
 
         assert agent.history == []
 
-    def test_agent_get_history(self, mock_odoo_client, discovery_service, monkeypatch):
+    @requires_llm
+    def test_agent_get_history(self, agent):
         """Test getting conversation history."""
-        import os
-        from tests.conftest import get_llm_api_key
-        if not get_llm_api_key():
-            pytest.skip("No LLM API key configured")
-
-        from src.agent.langchain_agent import OdooAgent
-
-        agent = OdooAgent(mock_odoo_client, discovery_service)
         test_history = [{"role": "user", "content": "test"}]
         agent.history = test_history
 
         assert agent.get_history() == test_history
 
 
+@requires_llm
 class TestAgentHandlers:
     """Test agent handler methods."""
 
     @pytest.mark.asyncio
-    async def test_handle_metadata_returns_dynamic_info(self, mock_odoo_client, discovery_service):
+    async def test_handle_metadata_returns_dynamic_info(self, agent):
         """Test that metadata handler returns dynamic model information."""
-        from tests.conftest import get_llm_api_key
-        if not get_llm_api_key():
-            pytest.skip("No LLM API key configured")
-
-        from src.agent.langchain_agent import OdooAgent
-
-        agent = OdooAgent(mock_odoo_client, discovery_service)
         response = await agent._handle_metadata()
 
         assert response is not None
@@ -124,141 +120,61 @@ class TestAgentHandlers:
         assert "10" in response["content"]  # Should mention model count (mock has 10 models)
 
     @pytest.mark.asyncio
-    async def test_handle_query_without_model(self, mock_odoo_client, discovery_service):
+    async def test_handle_query_without_model(self, agent):
         """Test query handler asks for clarification when model is not specified."""
-        from tests.conftest import get_llm_api_key
-        if not get_llm_api_key():
-            pytest.skip("No LLM API key configured")
-
-        from src.agent.langchain_agent import OdooAgent
-
-        agent = OdooAgent(mock_odoo_client, discovery_service)
         response = await agent._handle_query(None, {}, "show me data")
 
         assert response is not None
         assert response.get("type") == "clarification"
 
     @pytest.mark.asyncio
-    async def test_handle_query_with_model(self, mock_odoo_client, discovery_service):
+    async def test_handle_query_with_model(self, agent):
         """Test query handler executes search when model is specified."""
-        from tests.conftest import get_llm_api_key
-        if not get_llm_api_key():
-            pytest.skip("No LLM API key configured")
-
-        from src.agent.langchain_agent import OdooAgent
-
-        agent = OdooAgent(mock_odoo_client, discovery_service)
         response = await agent._handle_query("res.partner", {"limit": 5}, "show me contacts")
 
         assert response is not None
         assert response.get("type") == "query_result"
         assert response.get("model") == "res.partner"
-        mock_odoo_client.search_read.assert_called()
+        agent.odoo.search_read.assert_called()
 
 
+@requires_llm
 class TestExecuteConfirmedAction:
     """Test action execution functionality."""
 
     @pytest.mark.asyncio
-    async def test_execute_create_action(self, mock_odoo_client, discovery_service):
-        """Test executing a create action."""
-        from tests.conftest import get_llm_api_key
-        if not get_llm_api_key():
-            pytest.skip("No LLM API key configured")
-
-        from src.agent.langchain_agent import OdooAgent
-
-        mock_odoo_client.execute_method.return_value = 123  # New record ID
-
-        agent = OdooAgent(mock_odoo_client, discovery_service)
-        result = await agent.execute_confirmed_action({
-            "operation": "create",
-            "model": "res.partner",
-            "values": {"name": "Test Partner"},
-        })
+    @pytest.mark.parametrize("payload,expected_call", [
+        (
+            {"operation": "create", "model": "res.partner", "values": {"name": "Test Partner"}},
+            ("res.partner", "create", [{"name": "Test Partner"}]),
+        ),
+        (
+            {"operation": "update", "model": "res.partner", "record_id": 1, "values": {"name": "Updated Name"}},
+            ("res.partner", "write", [[1], {"name": "Updated Name"}]),
+        ),
+        (
+            {"operation": "delete", "model": "res.partner", "record_id": 1},
+            ("res.partner", "unlink", [[1]]),
+        ),
+        (
+            {"operation": "action", "model": "sale.order", "record_id": 1, "method": "action_confirm"},
+            ("sale.order", "action_confirm", [[1]]),
+        ),
+    ], ids=["create", "update", "delete", "workflow"])
+    async def test_execute_action(self, agent, monkeypatch, payload, expected_call):
+        """Test executing each confirmed operation against the Odoo client."""
+        monkeypatch.setattr(agent.odoo.execute_method, "return_value", 123)  # New record ID
+
+        result = await agent.execute_confirmed_action(payload)
 
         assert result["success"] is True
-        assert result["record_id"] == 123
-        mock_odoo_client.execute_method.assert_called_with(
-            "res.partner", "create", [{"name": "Test Partner"}]
-        )
+        if payload["operation"] == "create":
+            assert result["record_id"] == 123
+        agent.odoo.execute_method.assert_called_with(*expected_call)
 
     @pytest.mark.asyncio
-    async def test_execute_update_action(self, mock_odoo_client, discovery_service):
-        """Test executing an update action."""
-        from tests.conftest import get_llm_api_key
-        if not get_llm_api_key():
-            pytest.skip("No LLM API key configured")
-
-        from src.agent.langchain_agent import OdooAgent
-
-        agent = OdooAgent(mock_odoo_client, discovery_service)
-        result = await agent.execute_confirmed_action({
-            "operation": "update",
-            "model": "res.partner",
-            "record_id": 1,
-            "values": {"name": "Updated Name"},
-        })
-
-        assert result["success"] is True
-        mock_odoo_client.execute_method.assert_called_with(
-            "res.partner", "write", [[1], {"name": "Updated Name"}]
-        )
-
-    @pytest.mark.asyncio
-    async def test_execute_delete_action(self, mock_odoo_client, discovery_service):
-        """Test executing a delete action."""
-        from tests.conftest import get_llm_api_key
-        if not get_llm_api_key():
-            pytest.skip("No LLM API key configured")
-
-        from src.agent.langchain_agent import OdooAgent
-
-        agent = OdooAgent(mock_odoo_client, discovery_service)
-        result = await agent.execute_confirmed_action({
-            "operation": "delete",
-            "model": "res.partner",
-            "record_id": 1,
-        })
-
-        assert result["success"] is True
-        mock_odoo_client.execute_method.assert_called_with(
-            "res.partner", "unlink", [[1]]
-        )
-
-    @pytest.mark.asyncio
-    async def test_execute_workflow_action(self, mock_odoo_client, discovery_service):
-        """Test executing a workflow action."""
-        from tests.conftest import get_llm_api_key
-        if not get_llm_api_key():
-            pytest.skip("No LLM API key configured")
-
-        from src.agent.langchain_agent import OdooAgent
-
-        agent = OdooAgent(mock_odoo_client, discovery_service)
-        result = await agent.execute_confirmed_action({
-            "operation": "action",
-            "model": "sale.order",
-            "record_id": 1,
-            "method": "action_confirm",
-        })
-
-        assert result["success"] is True
-        mock_odoo_client.execute_method.assert_called_with(
-            "sale.order", "action_confirm", [[1]]
-        )
-
-    @pytest.mark.asyncio
-    async def test_execute_action_missing_params(self, mock_odoo_client, discovery_service):
+    async def test_execute_action_missing_params(self, agent):
         """Test that missing parameters return error."""
-        from tests.conftest import get_llm_api_key
-        if not get_llm_api_key():
-            pytest.skip("No LLM API key configured")
-
-        from src.agent.langchain_agent import OdooAgent
-
-        agent = OdooAgent(mock_odoo_client, discovery_service)
-
         # Missing model
         result = await agent.execute_confirmed_action({
             "operation": "create",
@@ -274,15 +190,8 @@ class TestExecuteConfirmedAction:
         assert result["success"] is False
 
     @pytest.mark.asyncio
-    async def test_execute_action_unknown_operation(self, mock_odoo_client, discovery_service):
+    async def test_execute_action_unknown_operation(self, agent):
         """Test that unknown operation returns error."""
-        from tests.conftest import get_llm_api_key
-        if not get_llm_api_key():
-            pytest.skip("No LLM API key configured")
-
-        from src.agent.langchain_agent import OdooAgent
-
-        agent = OdooAgent(mock_odoo_client, discovery_service)
         result = await agent.execute_confirmed_action({
             "operation": "unknown_operation",
             "model": "res.partner",
@@ -6,49 +6,29 @@ Tests the settings and configuration loading.
 import pytest
 import os
 
+from src.config import Settings, get_settings, reload_settings
+
 
 class TestSettings:
     """Test Settings class."""
 
     def test_settings_loads(self):
         """Test that settings can be loaded."""
-        from src.config import get_settings
-
         settings = get_settings()
 
         assert settings is not None
 
-    def test_settings_has_odoo_fields(self):
-        """Test that settings has Odoo configuration fields."""
-        from src.config import Settings
-
-        # Check that the class has expected fields
-        assert hasattr(Settings, 'model_fields')
-        fields = Settings.model_fields
-
-        odoo_fields = ['odoo_url', 'odoo_db', 'odoo_username', 'odoo_password']
-        for field in odoo_fields:
-            assert field in fields, f"Settings should have {field} field"
-
-    def test_settings_has_llm_fields(self):
-        """Test that settings has LLM configuration fields."""
-        from src.config import Settings
-
-        fields = Settings.model_fields
-
-        llm_fields = ['anthropic_api_key', 'openai_api_key', 'google_api_key', 'llm_provider', 'llm_model']
-        for field in llm_fields:
-            assert field in fields, f"Settings should have {field} field"
-
-    def test_settings_has_security_fields(self):
-        """Test that settings has security configuration fields."""
-        from src.config import Settings
-
-        fields = Settings.model_fields
-
-        security_fields = ['api_key_enabled', 'admin_api_key', 'read_only_mode', 'rate_limit_per_minute']
-        for field in security_fields:
-            assert field in fields, f"Settings should have {field} field"
+    @pytest.mark.parametrize("field", [
+        # Odoo
+        "odoo_url", "odoo_db", "odoo_username", "odoo_password",
+        # LLM
+        "anthropic_api_key", "openai_api_key", "google_api_key", "llm_provider", "llm_model",
+        # Security
+        "api_key_enabled", "admin_api_key", "read_only_mode", "rate_limit_per_minute",
+    ])
+    def test_settings_has_field(self, field):
+        """Test that settings declares each expected configuration field."""
+        assert field in Settings.model_fields, f"Settings should have {field} field"
 
     def test_settings_defaults(self, monkeypatch):
         """Test that settings has reasonable defaults."""
@@ -60,8 +40,6 @@ class TestSettings:
         for var in env_vars_to_clear:
             monkeypatch.delenv(var, raising=False)
 
-        from src.config import Settings
-
         # Create settings without any env vars (using test isolation)
         settings = Settings(
             _env_file=None,  # Don't load .env file
@@ -74,15 +52,20 @@ class TestSettings:
         assert settings.chainlit_port == 8080
         assert settings.model_cache_ttl == 300
 
-    def test_settings_reload(self, monkeypatch):
-        """Test that settings can be reloaded."""
-        from src.config import reload_settings
+    def test_settings_reload(self):
+        """Test that settings pick up a new Odoo URL."""
+        settings = Settings(_env_file=None, odoo_url="http://test-reload.com")
 
+        assert settings.odoo_url == "http://test-reload.com"
+
+    def test_reload_settings_reads_environment(self, monkeypatch):
+        """Test that reload_settings rebuilds settings from the environment."""
         monkeypatch.setenv("ODOO_URL", "http://test-reload.com")
 
         settings = reload_settings()
 
         assert settings.odoo_url == "http://test-reload.com"
+        assert get_settings() is settings
 
     def test_settings_logs_directory(self, test_settings):
         """Test that logs directory is created."""
@@ -94,43 +77,18 @@ class TestSettings:
         assert isinstance(logs_dir, Path)
 
 
-class TestSettingsFromEnv:
-    """Test settings loaded from environment."""
-
-    def test_odoo_url_from_env(self, monkeypatch):
-        """Test ODOO_URL loaded from environment."""
-        from src.config import reload_settings
+class TestSettingsOverrides:
+    """Test settings built from explicit values."""
 
-        monkeypatch.setenv("ODOO_URL", "https://my-odoo.example.com")
-        settings = reload_settings()
-
-        assert settings.odoo_url == "https://my-odoo.example.com"
-
-    def test_llm_provider_from_env(self, monkeypatch):
-        """Test LLM_PROVIDER loaded from environment."""
-        from src.config import reload_settings
-
-        monkeypatch.setenv("LLM_PROVIDER", "openai")
-        settings = reload_settings()
-
-        assert settings.llm_provider == "openai"
-
-    def test_read_only_mode_from_env(self, monkeypatch):
-        """Test READ_ONLY_MODE loaded from environment."""
-        from src.config import reload_settings
-
-        monkeypatch.setenv("READ_ONLY_MODE", "true")
-        settings = reload_settings()
-
-        assert settings.read_only_mode is True
-
-    def test_rate_limits_from_env(self, monkeypatch):
-        """Test rate limits loaded from environment."""
-        from src.config import reload_settings
-
-        monkeypatch.setenv("RATE_LIMIT_PER_MINUTE", "50")
-        monkeypatch.setenv("RATE_LIMIT_PER_HOUR", "500")
-        settings = reload_settings()
+    @pytest.mark.parametrize("kwargs,attr,expected", [
+        ({"odoo_url": "https://my-odoo.example.com"}, "odoo_url", "https://my-odoo.example.com"),
+        ({"llm_provider": "openai"}, "llm_provider", "openai"),
+        ({"read_only_mode": True}, "read_only_mode", True),
+        ({"rate_limit_per_minute": 50, "rate_limit_per_hour": 500}, "rate_limit_per_minute", 50),
+        ({"rate_limit_per_minute": 50, "rate_limit_per_hour": 500}, "rate_limit_per_hour", 500),
+    ])
+    def test_setting_override(self, kwargs, attr, expected):
+        """Test that explicit values override defaults."""
+        settings = Settings(_env_file=None, **kwargs)
 
-        assert settings.rate_limit_per_minute == 50
-        assert settings.rate_limit_per_hour == 500
+        assert getattr(settings, attr) == expected
@@ -6,47 +6,33 @@ Tests the dynamic model discovery functionality.
 import pytest
 from unittest.mock import MagicMock
 
+from src.extensions.discovery import OdooModelDiscovery
+
+
+@pytest.fixture
+def discovery(mock_odoo_client):
+    """Discovery service over the per-test mock client."""
+    return OdooModelDiscovery(mock_odoo_client, cache_ttl=60)
+
 
 class TestOdooModelDiscovery:
     """Test OdooModelDiscovery service."""
 
-    def test_discovery_initialization(self, mock_odoo_client):
+    def test_discovery_initialization(self, discovery):
         """Test discovery service initialization."""
-        from src.extensions.discovery import OdooModelDiscovery
-
-        discovery = OdooModelDiscovery(mock_odoo_client, cache_ttl=60)
-
         assert discovery is not None
         assert discovery.cache_ttl == 60
 
-    def test_discovery_get_all_models(self, mock_odoo_client):
+    def test_discovery_get_all_models(self, discovery, mock_odoo_client):
         """Test getting all models."""
-        from src.extensions.discovery import OdooModelDiscovery
-
-        discovery = OdooModelDiscovery(mock_odoo_client, cache_ttl=60)
         models = discovery.get_all_models()
 
         assert models is not None
         assert isinstance(models, dict)
         mock_odoo_client.get_models.assert_called()
 
-    def test_discovery_get_model_fields(self, mock_odoo_client):
-        """Test getting fields for a model."""
-        from src.extensions.discovery import OdooModelDiscovery
-
-        discovery = OdooModelDiscovery(mock_odoo_client, cache_ttl=60)
-        fields = discovery.get_model_fields("res.partner")
-
-        assert fields is not None
-        assert isinstance(fields, dict)
-        mock_odoo_client.get_model_fields.assert_called_with("res.partner")
-
-    def test_discovery_caching(self, mock_odoo_client):
+    def test_discovery_caching(self, discovery, mock_odoo_client):
         """Test that discovery results are cached."""
-        from src.extensions.discovery import OdooModelDiscovery
-
-        discovery = OdooModelDiscovery(mock_odoo_client, cache_ttl=60)
-
         # First call
         fields1 = discovery.get_model_fields("res.partner")
         # Second call should use cache
@@ -54,38 +40,32 @@ class TestOdooModelDiscovery:
 
         assert fields1 == fields2
         # Should only call Odoo once due to caching
-        assert mock_odoo_client.get_model_fields.call_count == 1
-
-    def test_discovery_get_model_methods(self, mock_odoo_client):
-        """Test getting methods for a model."""
-        from src.extensions.discovery import OdooModelDiscovery
-
-        discovery = OdooModelDiscovery(mock_odoo_client, cache_ttl=60)
-        methods = discovery.get_model_methods("sale.order")
-
-        assert methods is not None
-        assert isinstance(methods, list)
-        # Should include common methods
-        assert "create" in methods
-        assert "write" in methods
-        # Should include model-specific methods
-        assert "action_confirm" in methods
-
-    def test_discovery_search_models_by_keyword(self, mock_odoo_client):
-        """Test searching models by keyword."""
-        from src.extensions.discovery import OdooModelDiscovery
-
-        discovery = OdooModelDiscovery(mock_odoo_client, cache_ttl=60)
-        matching = discovery.search_models_by_keyword("partner")
-
-        assert matching is not None
-        assert isinstance(matching, list)
-
-    def test_discovery_get_model_summary(self, mock_odoo_client):
+        mock_odoo_client.get_model_fields.assert_called_once_with("res.partner")
+
+    @pytest.mark.parametrize("method,arg,expected_type,expected_items", [
+        ("get_model_fields", "res.partner", dict, ["name", "email"]),
+        # Common methods plus model-specific ones
+        ("get_model_methods", "sale.order", list, ["create", "write", "action_confirm"]),
+        ("search_models_by_keyword", "partner", list, ["res.partner"]),
+    ])
+    def test_discovery_read_path(self, discovery, method, arg, expected_type, expected_items):
+        """Test the discovery lookups return the expected shape and entries."""
+        result = getattr(discovery, method)(arg)
+
+        assert isinstance(result, expected_type)
+        for item in expected_items:
+            assert item in result
+
+    def test_discovery_methods_not_shared(self, discovery):
+        """Test that mutating returned methods does not leak into later calls."""
+        discovery.get_model_methods("sale.order").append("injected")
+        discovery.get_model_summary("sale.order")["common_methods"].clear()
+
+        assert "injected" not in discovery.get_model_methods("sale.order")
+        assert "action_confirm" in discovery.get_model_methods("sale.order")
+
+    def test_discovery_get_model_summary(self, discovery):
         """Test getting model summary."""
-        from src.extensions.discovery import OdooModelDiscovery
-
-        discovery = OdooModelDiscovery(mock_odoo_client, cache_ttl=60)
         # First get models so cache is populated
         discovery.get_all_models()
         summary = discovery.get_model_summary("res.partner")
@@ -93,12 +73,19 @@ class TestOdooModelDiscovery:
         assert summary is not None
         assert isinstance(summary, dict)
 
-    def test_discovery_refresh_cache(self, mock_odoo_client):
-        """Test cache refresh."""
-        from src.extensions.discovery import OdooModelDiscovery
+    def test_discovery_force_refresh_failure_keeps_cache(self, discovery, mock_odoo_client, monkeypatch):
+        """Test that a failed forced refresh warns and returns the cached fields."""
+        logger = MagicMock()
+        monkeypatch.setattr("src.extensions.discovery.logger", logger)
+        cached = discovery.get_model_fields("res.partner")
+        mock_odoo_client.get_model_fields.side_effect = ConnectionError("Odoo down")
 
-        discovery = OdooModelDiscovery(mock_odoo_client, cache_ttl=60)
+        assert discovery.get_model_fields("res.partner", force_refresh=True) == cached
+        assert mock_odoo_client.get_model_fields.call_count == 2
+        logger.warning.assert_called_once()
 
+    def test_discovery_refresh_cache(self, discovery, mock_odoo_client):
+        """Test cache refresh."""
         # First call
         discovery.get_model_fields("res.partner")
         # Refresh cache
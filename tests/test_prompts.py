@@ -3,8 +3,19 @@ Tests for prompt templates.
 
 Tests the prompt generation and formatting.
 """
+from functools import lru_cache
+
 import pytest
 
+REQUIRED_INTENTS = ("QUERY", "CREATE", "UPDATE", "DELETE", "ACTION", "ATTACH", "MESSAGE", "METADATA")
+
+
+@lru_cache
+def _system(prompt_name):
+    """Render a prompt template's system message once per module."""
+    from src.agent import prompts
+    return str(getattr(prompts, prompt_name).messages[0])
+
 
 class TestIntentClassifierPrompt:
     """Test intent classifier prompt."""
@@ -19,34 +30,23 @@ class TestIntentClassifierPrompt:
 
     def test_prompt_has_multilingual_support(self):
         """Test that prompt mentions multilingual support."""
-        from src.agent.prompts import INTENT_CLASSIFIER_PROMPT
-
         # Check the system message contains multilingual instruction
-        messages = INTENT_CLASSIFIER_PROMPT.messages
-        system_message = str(messages[0])
+        system_message = _system("INTENT_CLASSIFIER_PROMPT")
 
         assert "ANY language" in system_message or "any language" in system_message.lower()
 
     def test_prompt_has_model_placeholder(self):
         """Test that prompt has placeholder for available models."""
-        from src.agent.prompts import INTENT_CLASSIFIER_PROMPT
-
-        messages = INTENT_CLASSIFIER_PROMPT.messages
-        system_message = str(messages[0])
+        system_message = _system("INTENT_CLASSIFIER_PROMPT")
 
         assert "available_models" in system_message
 
     def test_prompt_has_all_intents(self):
         """Test that prompt includes all intent categories."""
-        from src.agent.prompts import INTENT_CLASSIFIER_PROMPT
+        system_message = _system("INTENT_CLASSIFIER_PROMPT")
 
-        messages = INTENT_CLASSIFIER_PROMPT.messages
-        system_message = str(messages[0])
-
-        required_intents = ["QUERY", "CREATE", "UPDATE", "DELETE", "ACTION", "ATTACH", "MESSAGE", "METADATA"]
-
-        for intent in required_intents:
-            assert intent in system_message, f"Intent {intent} should be in prompt"
+        missing = [intent for intent in REQUIRED_INTENTS if intent not in system_message]
+        assert not missing, f"Intents {missing} should be in prompt"
 
 
 class TestGeneralAssistantPrompt:
@@ -62,10 +62,7 @@ class TestGeneralAssistantPrompt:
 
     def test_prompt_has_language_rule(self):
         """Test that prompt has language matching rule."""
-        from src.agent.prompts import GENERAL_ASSISTANT_PROMPT
-
-        messages = GENERAL_ASSISTANT_PROMPT.messages
-        system_message = str(messages[0])
+        system_message = _system("GENERAL_ASSISTANT_PROMPT")
 
         assert "SAME LANGUAGE" in system_message or "same language" in system_message.lower()
 
@@ -91,10 +88,7 @@ class TestQueryGeneratorPrompt:
 
     def test_prompt_mentions_domain_syntax(self):
         """Test that prompt explains Odoo domain syntax."""
-        from src.agent.prompts import QUERY_GENERATOR_PROMPT
-
-        messages = QUERY_GENERATOR_PROMPT.messages
-        system_message = str(messages[0])
+        system_message = _system("QUERY_GENERATOR_PROMPT")
 
         assert "domain" in system_message.lower()
 
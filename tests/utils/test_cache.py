@@ -1,7 +1,14 @@
 import pytest
-import time
 import threading
-from src.utils.cache import TTLCache
+from src.utils.cache import CacheStats, TTLCache
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Fake monotonic clock for the cache; advance it with clock[0] += seconds."""
+    now = [1000.0]
+    monkeypatch.setattr("src.utils.cache.monotonic", lambda: now[0])
+    return now
 
 
 class TestTTLCache:
@@ -14,11 +21,11 @@ class TestTTLCache:
         cache = TTLCache(ttl_seconds=60)
         assert cache.get("missing") is None
 
-    def test_ttl_expiration(self):
+    def test_ttl_expiration(self, clock):
         cache = TTLCache(ttl_seconds=1)
         cache.set("key1", "value1")
         assert cache.get("key1") == "value1"
-        time.sleep(1.1)
+        clock[0] += 1.1
         assert cache.get("key1") is None
 
     def test_max_size_eviction(self):
@@ -60,6 +67,19 @@ class TestTTLCache:
         assert cache.get("user:2:profile") == {"name": "Bob"}
         assert cache.get("product:1") == {"name": "Widget"}
 
+    def test_invalidate_multiple_patterns(self):
+        """Test invalidating several prefixes in one call."""
+        cache = TTLCache(ttl_seconds=60)
+        cache.set("user:1:profile", {"name": "Alice"})
+        cache.set("user:2:profile", {"name": "Bob"})
+        cache.set("product:1", {"name": "Widget"})
+
+        count = cache.invalidate_pattern("user:1:", "product:")
+        assert count == 2
+        assert cache.get("user:1:profile") is None
+        assert cache.get("product:1") is None
+        assert cache.get("user:2:profile") == {"name": "Bob"}
+
     def test_invalidate_pattern_no_matches(self):
         """Test pattern invalidation with no matches."""
         cache = TTLCache(ttl_seconds=60)
@@ -95,6 +115,30 @@ class TestTTLCache:
         assert stats["hit_rate"] == 0.5
         assert stats["size"] == 2
 
+    def test_snapshot(self):
+        """Test the tuple form of the statistics."""
+        cache = TTLCache(ttl_seconds=60, max_size=10)
+        cache.set("key1", "value1")
+        cache.get("key1")
+
+        assert cache.snapshot() == CacheStats(hits=1, misses=0, hit_rate=1.0, size=1, max_size=10)
+
+    def test_get_or_set(self):
+        """Test that the factory only runs on a miss and None is not cached."""
+        cache = TTLCache(ttl_seconds=60)
+        calls = []
+
+        def factory():
+            calls.append(1)
+            return "value"
+
+        assert cache.get_or_set("key1", factory) == "value"
+        assert cache.get_or_set("key1", factory) == "value"
+        assert len(calls) == 1
+
+        assert cache.get_or_set("none", lambda: None) is None
+        assert cache.stats()["size"] == 1
+
     def test_update_existing_key(self):
         """Test updating an existing key."""
         cache = TTLCache(ttl_seconds=60, max_size=3)
@@ -202,14 +246,14 @@ class TestTTLCache:
         # But size should be 0
         assert stats["size"] == 0
 
-    def test_expired_entries_removed_on_access(self):
+    def test_expired_entries_removed_on_access(self, clock):
         """Test that expired entries are removed when accessed."""
         cache = TTLCache(ttl_seconds=1)
         cache.set("key1", "value1")
         cache.set("key2", "value2")
 
-        # Wait for expiration
-        time.sleep(1.1)
+        # Advance past expiration
+        clock[0] += 1.1
 
         # Accessing expired key should remove it
         assert cache.get("key1") is None
@@ -1,4 +1,7 @@
 # tests/utils/test_error_sanitizer.py
+import random
+import re
+
 import pytest
 from src.utils.error_sanitizer import ErrorSanitizer
 
@@ -155,3 +158,48 @@ xmlrpc.client.Fault: psycopg2.errors.UniqueViolation: ValidationError: Duplicate
         result = ErrorSanitizer.sanitize(raw)
         # Should not fail and should remove the file reference
         assert "File" not in result or result == "An error occurred during the operation."
+
+    def test_unclosed_frame_header_matches_sequential_removal(self):
+        """Test that an open File " header is cleaned as by the ordered patterns."""
+        raw = 'File "line 9Traceback (most recent call last):\n", line 4'
+        result = ErrorSanitizer.sanitize(raw)
+        # The traceback pattern runs first and leaves the frame header open
+        assert result == 'File "line 9'
+
+    def test_path_inside_traceback_is_removed_with_it(self):
+        """Test that a path glued to an exception name does not leak fragments."""
+        raw = "Traceback (most recent call last): /opt/odoo/addonsException: field 'partner_id'"
+        assert ErrorSanitizer._clean_detail(raw) == ""
+
+    def test_clean_detail_matches_sequential_removal(self):
+        """Test removal against applying REMOVE_PATTERNS one by one with re.sub."""
+        fragments = [
+            "Traceback (most recent call last):\n", 'File "', '", line 4', "\n",
+            '  File "/home/u/x.py", line 3, in f\n', "/opt/odoo/addons", "/usr/lib/a.py",
+            "/srv/app/models.py:12 ", "Exception: ", "ValueError: ", "field 'partner_id' ",
+            "xmlrpc", ".client.", "odoo.exceptions.", "psycopg2.errors.", "sale.order ", "x",
+        ]
+        rng = random.Random(0)
+        for _ in range(2000):
+            raw = "".join(rng.choice(fragments) for _ in range(rng.randint(1, 8)))
+            expected = raw
+            for pattern in ErrorSanitizer.REMOVE_PATTERNS:
+                expected = re.sub(pattern, "", expected, flags=re.DOTALL | re.MULTILINE)
+            assert ErrorSanitizer._clean_detail(raw) == ErrorSanitizer._normalize(expected), raw
+
+    def test_long_traceback_without_error_type(self):
+        """Test that a huge traceback with no error line is removed in linear time."""
+        raw = "Traceback (most recent call last):" + "x" * 100000
+        result = ErrorSanitizer.sanitize(raw)
+        assert result == "An error occurred during the operation."
+
+    def test_repeated_message_is_memoized(self):
+        """Test that sanitizing the same message twice reuses the first result."""
+        ErrorSanitizer.clear_cache()
+        raw = "ValidationError: Error with sale.order record"
+
+        first = ErrorSanitizer.sanitize(raw)
+        second = ErrorSanitizer.sanitize(raw)
+
+        assert first == second
+        assert ErrorSanitizer._sanitize_text.cache_info().hits == 1
@@ -202,6 +202,15 @@ class TestSmartFieldSelector:
         # state pattern (300) + required (500) + selection (100) + stored (50) + searchable (30) = 980
         assert score >= 900
 
+    def test_calculate_score_first_pattern_wins(self):
+        """Test that the first matching business pattern sets the bonus."""
+        meta = {"type": "datetime"}
+        # "date" is listed before "create_date", so both score as "date"
+        assert SmartFieldSelector._calculate_score("create_date", meta) == \
+            SmartFieldSelector._calculate_score("date", meta)
+        assert SmartFieldSelector._calculate_score("Partner_Email", {"type": "char"}) == 100 + 250 + 50
+        assert SmartFieldSelector._calculate_score("xyz", {"type": "char"}) == 100 + 50
+
     def test_empty_fields_info(self):
         """Test handling of empty fields_info dictionary."""
         fields_info = {}
@@ -309,3 +318,28 @@ class TestSmartFieldSelector:
         assert "partner_id" in result
         # description (text) should be included before many2many/one2many
         assert "description" in result
+
+    def test_select_cache_returns_copies(self):
+        """Test that a cached selection cannot be mutated by the caller."""
+        SmartFieldSelector.clear_cache()
+        fields_info = {
+            "id": {"type": "integer"},
+            "name": {"type": "char"},
+            "email": {"type": "char"},
+        }
+        first = SmartFieldSelector.select(fields_info)
+        first.append("injected")
+
+        assert SmartFieldSelector.select(fields_info) == first[:-1]
+
+    def test_select_cache_tracks_field_metadata(self):
+        """Test that changed field metadata is not served from the cache."""
+        SmartFieldSelector.clear_cache()
+        fields_info = {
+            "id": {"type": "integer"},
+            "notes": {"type": "char"},
+        }
+        assert "notes" in SmartFieldSelector.select(fields_info)
+
+        fields_info["notes"] = {"type": "html"}
+        assert "notes" not in SmartFieldSelector.select(fields_info)